@@ -9,7 +9,6 @@ from rich.table import Table
 from rich.markdown import Markdown
 from rich.syntax import Syntax
 from rich.json import JSON
-import json
 from utils import (
     APIClient, create_table, console, print_success, print_error,
     print_warning, print_info, print_panel, print_json, select_algorithm
@@ -76,21 +75,21 @@ def execute(args):
         print_algorithms_help()
         return
         
-    client = APIClient()
-    
     if not args.action:
         print_algorithms_help()
         return
     
-    if args.action == 'list':
-        list_algorithms(client, args)
-    elif args.action == 'show':
-        show_algorithm(client, args)
+    # Close pooled connections once the command is done
+    with APIClient() as client:
+        if args.action == 'list':
+            list_algorithms(client, args)
+        elif args.action == 'show':
+            show_algorithm(client, args)
 
 def list_algorithms(client: APIClient, args):
     """List all available algorithms"""
     with console.status("[red]Fetching algorithms...[/red]"):
-        response = client.get("/algorithms")
+        response = client.get_cached("/algorithms")
     
     if not response:
         return
@@ -133,7 +132,7 @@ def show_algorithm(client: APIClient, args):
     
     # New API exposes only a list; fetch all and filter client-side
     with console.status(f"[red]Fetching algorithm '{algorithm_name}'...[/red]"):
-        algos = client.get("/algorithms")
+        algos = client.get_cached("/algorithms")
     if not algos:
         return
     response = None
@@ -161,7 +160,7 @@ def show_algorithm(client: APIClient, args):
     config_schema = response.get('config_schema') or {}
     if config_schema:
         console.print("\n[bold red]Config Schema:[/bold red]")
-        console.print(JSON(json.dumps(config_schema)))
+        console.print(JSON.from_data(config_schema))
     
     # Display diagram if available
     chart = response.get('chart')
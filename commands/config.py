@@ -4,10 +4,9 @@ Config command - Manage and validate configurations
 
 import argparse
 import json
-import yaml
 from pathlib import Path
 from typing import Optional, Dict, Any
-from utils import load_yaml_config, print_json
+from utils import load_yaml_config, print_json, yaml_dump
 
 def add_parser(subparsers):
     """Add config command parser"""
@@ -153,7 +152,7 @@ def show_config(config_file: str, as_json: bool):
         print_json(config)
     else:
         print(f"📄 Configuration: {Path(config_file).absolute()}\n")
-        print(yaml.dump(config, default_flow_style=False, sort_keys=False))
+        print(yaml_dump(config))
 
 def convert_config(config_file: str, output_file: Optional[str]):
     """Convert YAML configuration to JSON"""
@@ -309,10 +308,10 @@ def generate_template(attack_type: str, output_file: Optional[str]):
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
         with open(output_path, 'w') as f:
-            yaml.dump(template, f, default_flow_style=False, sort_keys=False)
+            yaml_dump(template, f)
         
         print(f"✅ Template generated: {output_path.absolute()}")
         print(f"📝 Edit the file to customize your {attack_type.upper()} attack configuration")
     else:
         print(f"# {attack_type.upper()} Attack Configuration Template\n")
-        print(yaml.dump(template, default_flow_style=False, sort_keys=False))
+        print(yaml_dump(template))
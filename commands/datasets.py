@@ -104,29 +104,29 @@ def execute(args):
         print_datasets_help()
         return
         
-    client = APIClient()
-    
     if not args.action:
         print_datasets_help()
         return
     
-    if args.action == 'list':
-        list_datasets(client, args)
-    elif args.action == 'show':
-        show_dataset(client, args)
-    elif args.action == 'entries':
-        show_entries(client, args)
-    elif args.action == 'export':
-        export_dataset(client, args)
-    elif args.action == 'create':
-        create_dataset(client, args)
-    elif args.action == 'delete':
-        delete_dataset(client, args)
+    # Close pooled connections once the command is done
+    with APIClient() as client:
+        if args.action == 'list':
+            list_datasets(client, args)
+        elif args.action == 'show':
+            show_dataset(client, args)
+        elif args.action == 'entries':
+            show_entries(client, args)
+        elif args.action == 'export':
+            export_dataset(client, args)
+        elif args.action == 'create':
+            create_dataset(client, args)
+        elif args.action == 'delete':
+            delete_dataset(client, args)
 
 def list_datasets(client: APIClient, args):
     """List all datasets"""
     with console.status("[red]Fetching datasets...[/red]"):
-        response = client.get("/datasets")
+        response = client.get_cached("/datasets")
     
     if not response:
         return
@@ -389,7 +389,8 @@ def create_dataset(client: APIClient, args):
 
 def delete_dataset(client: APIClient, args):
     """Delete a dataset"""
-    dataset_id = select_dataset(client, getattr(args, 'dataset_name', None))
+    # Deleting must never act on an auto-selected dataset
+    dataset_id = select_dataset(client, getattr(args, 'dataset_name', None), confirm_single=True)
     if not dataset_id:
         return
     
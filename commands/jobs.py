@@ -17,7 +17,8 @@ from utils import (
     APIClient, format_datetime, format_status_plain, print_json, 
     confirm_action, create_table, console, print_success, print_error,
     print_warning, print_info, print_panel, select_job, format_status,
-    load_yaml_config, save_to_csv, transform_config_for_api, select_dataset
+    load_yaml_config, save_to_csv, transform_config_for_api, select_dataset,
+    check_job_config
 )
 
 def print_jobs_help():
@@ -122,31 +123,34 @@ def execute(args):
         print_jobs_help()
         return
         
-    client = APIClient()
-    
     if not args.action:
         print_jobs_help()
         return
     
-    if args.action == 'list':
-        list_jobs(client, args)
-    elif args.action == 'show':
-        show_job(client, args)
-    elif args.action == 'results':
-        show_results(client, args)
-    elif args.action == 'export':
-        export_results(client, args)
-    elif args.action == 'attach':
-        attach_to_job(client, args)
-    elif args.action == 'delete':
-        delete_job(client, args)
-    elif args.action == 'run':
-        run_job(client, args)
+    # Close pooled connections once the command is done
+    with APIClient() as client:
+        if args.action == 'list':
+            list_jobs(client, args)
+        elif args.action == 'show':
+            show_job(client, args)
+        elif args.action == 'results':
+            show_results(client, args)
+        elif args.action == 'export':
+            export_results(client, args)
+        elif args.action == 'attach':
+            attach_to_job(client, args)
+        elif args.action == 'delete':
+            delete_job(client, args)
+        elif args.action == 'run':
+            run_job(client, args)
 
 def list_jobs(client: APIClient, args):
     """List all jobs"""
+    # Dataset names are only needed for the table; fetch them alongside the jobs
+    as_json = hasattr(args, 'json') and args.json
     with console.status("[red]Fetching jobs...[/red]"):
-        response = client.get("/jobs")
+        responses = client.get_many(["/jobs"] if as_json else ["/jobs", "/datasets"], cached=True)
+    response = responses["/jobs"]
     
     if not response:
         return
@@ -166,7 +170,7 @@ def list_jobs(client: APIClient, args):
         return
     
     # Output as JSON if requested
-    if hasattr(args, 'json') and args.json:
+    if as_json:
         print_json(jobs, title="Jobs")
         return
     
@@ -177,7 +181,7 @@ def list_jobs(client: APIClient, args):
     # Build dataset id -> name map for labeling
     ds_map = {}
     try:
-        ds_resp = client.get("/datasets")
+        ds_resp = responses["/datasets"]
         ds_list = ds_resp if isinstance(ds_resp, list) else (ds_resp.get('datasets', []) if ds_resp else [])
         for ds in ds_list:
             ds_map[ds.get('id')] = ds.get('name')
@@ -390,8 +394,10 @@ def attach_to_job(client: APIClient, args):
             )
             
             while True:
-                # Fetch job status
-                data = client.get(f"/jobs/{job_id}")
+                # Fetch job status and logs concurrently on the pooled session
+                job_endpoint, logs_endpoint = f"/jobs/{job_id}", f"/jobs/{job_id}/logs"
+                responses = client.get_many([job_endpoint, logs_endpoint])
+                data = responses[job_endpoint]
                 if not data:
                     break
                 
@@ -416,7 +422,7 @@ def attach_to_job(client: APIClient, args):
                 logs_table.add_column("Level", width=5, no_wrap=True)
                 logs_table.add_column("Message", width=80, no_wrap=False)
                 
-                logs_response = client.get(f"/jobs/{job_id}/logs")
+                logs_response = responses[logs_endpoint]
                 if logs_response and 'logs' in logs_response and len(logs_response['logs']) > 0:
                     # Get last 5 logs and reverse to show newest first
                     recent_logs = logs_response['logs'][-5:]
@@ -488,7 +494,7 @@ def delete_job(client: APIClient, args):
                 return
         
         # Delete all jobs
-        response = client.get("/jobs")
+        response = client.get_cached("/jobs")
         if not response:
             return
         
@@ -503,7 +509,8 @@ def delete_job(client: APIClient, args):
         
         print_success(f"Deleted {deleted_count} job(s)")
     else:
-        job_id = select_job(client, getattr(args, 'job_id', None))
+        # Deleting must never act on an auto-selected job
+        job_id = select_job(client, getattr(args, 'job_id', None), confirm_single=True)
         if not job_id:
             return
         
@@ -520,7 +527,7 @@ def delete_job(client: APIClient, args):
 def run_job(client: APIClient, args):
     """Run a new job from config file"""
     config = load_yaml_config(args.config_file)
-    if not config:
+    if not config or not check_job_config(config):
         return
     
     if getattr(args, 'dry_run', False):
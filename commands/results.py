@@ -1,17 +1,23 @@
 """
 Results command - Get and export job results
+
+Not registered in cli_main.py: `ga-red jobs results/export` are the CLI entry
+points, so this module is only reachable by importing it.
 """
 
 import argparse
 import json
+import sys
+from itertools import chain
 from pathlib import Path
 from typing import Optional
 from rich.console import Console
 from rich.table import Table
 from rich.style import Style
-from rich.live import Live
-import readchar
-from utils import APIClient, save_to_csv, print_json, format_status, format_datetime
+from utils import (
+    APIClient, save_to_csv, print_json, format_status, format_datetime, read_keys,
+    stream_errors
+)
 
 console = Console()
 
@@ -69,6 +75,9 @@ Examples:
         help='Show only failed attacks'
     )
 
+_SELECTED_ROW_STYLE = Style(bgcolor="dark_red", bold=True)
+_PLAIN_ROW_STYLE = Style()
+
 def render_job_table(jobs, selected_index):
     """Render the job table with highlighting for the selected row"""
     table = Table(title="Available Jobs - Use ↑↓ arrows to navigate, Enter to select, Ctrl+C to cancel", 
@@ -89,7 +98,7 @@ def render_job_table(jobs, selected_index):
         total = job.get('total_objectives', 0)
         
         # Apply selection highlighting
-        row_style = Style(bgcolor="dark_red", bold=True) if index == selected_index else Style()
+        row_style = _SELECTED_ROW_STYLE if index == selected_index else _PLAIN_ROW_STYLE
         status_formatted = format_status(status)
         
         table.add_row(
@@ -106,10 +115,13 @@ def render_job_table(jobs, selected_index):
 
 def select_job_interactive(client: APIClient) -> Optional[int]:
     """Interactive job selection using Rich table and readchar for navigation"""
+    import readchar
+    from rich.live import Live
+    
     console.print("[red]Fetching available jobs...[/red]")
     
     # Get all jobs
-    response = client.get("/jobs")
+    response = client.get_cached("/jobs")
     if not response:
         return None
     
@@ -120,24 +132,33 @@ def select_job_interactive(client: APIClient) -> Optional[int]:
     
     selected_index = 0
     
+    # Render the table once; moving the selection only restyles the two affected rows
+    table = render_job_table(jobs, selected_index)
+    rows = table.rows
+    
     try:
-        with Live(render_job_table(jobs, selected_index), console=console, auto_refresh=False) as live:
+        with Live(table, console=console, auto_refresh=False) as live:
             while True:
                 try:
-                    key = readchar.readkey()
+                    # Net out a burst of arrow keys and redraw once for the whole batch
+                    step = 0
+                    for key in read_keys():
+                        if key == readchar.key.UP:
+                            step -= 1
+                        elif key == readchar.key.DOWN:
+                            step += 1
+                        elif key == readchar.key.ENTER or key == '\r' or key == '\n':
+                            # Return the selected job ID
+                            selected_job = jobs[(selected_index + step) % len(jobs)]
+                            return selected_job.get('job_id')
+                        elif key == readchar.key.CTRL_C or key == '\x03':
+                            return None
                     
-                    if key == readchar.key.UP:
-                        selected_index = (selected_index - 1) % len(jobs)
-                        live.update(render_job_table(jobs, selected_index), refresh=True)
-                    elif key == readchar.key.DOWN:
-                        selected_index = (selected_index + 1) % len(jobs)
-                        live.update(render_job_table(jobs, selected_index), refresh=True)
-                    elif key == readchar.key.ENTER or key == '\r' or key == '\n':
-                        # Return the selected job ID
-                        selected_job = jobs[selected_index]
-                        return selected_job.get('job_id')
-                    elif key == readchar.key.CTRL_C or key == '\x03':
-                        return None
+                    if step % len(jobs):
+                        rows[selected_index].style = _PLAIN_ROW_STYLE
+                        selected_index = (selected_index + step) % len(jobs)
+                        rows[selected_index].style = _SELECTED_ROW_STYLE
+                        live.refresh()
                         
                 except KeyboardInterrupt:
                     return None
@@ -151,8 +172,12 @@ def select_job_interactive(client: APIClient) -> Optional[int]:
 
 def execute(args):
     """Execute results command"""
-    client = APIClient()
-    
+    # Close pooled connections once the command is done
+    with APIClient() as client:
+        _execute(client, args)
+
+def _execute(client: APIClient, args):
+    """Run the results command with an open client"""
     job_id = args.job_id
     
     # If no job_id provided, show interactive selector
@@ -161,6 +186,18 @@ def execute(args):
         if job_id is None:
             return
     
+    # Stream results straight into the CSV file; job fields come from the job record
+    if args.csv:
+        console.print(f"[red]Fetching results for job {job_id}...[/red]")
+        job = client.get(f"/jobs/{job_id}")
+        if not job:
+            return
+        results = client.iter_items(f"/jobs/{job_id}/results", 'results.item')
+        if results is None:
+            return
+        export_to_csv(job, filter_results(results, args.successful, args.failed), args.csv)
+        return
+    
     # Fetch results
     console.print(f"[red]Fetching results for job {job_id}...[/red]")
     data = client.get(f"/jobs/{job_id}/results")
@@ -176,15 +213,8 @@ def execute(args):
         return
     
     # Filter results if requested
-    if args.successful:
-        results = [r for r in results if r.get('success')]
-    elif args.failed:
-        results = [r for r in results if not r.get('success')]
-    
-    # Export to CSV if requested
-    if args.csv:
-        export_to_csv(job, results, args.csv)
-        return
+    if args.successful or args.failed:
+        results = list(filter_results(results, args.successful, args.failed))
     
     # Output as JSON if requested
     if args.json:
@@ -201,18 +231,46 @@ def execute(args):
     else:
         display_full_results(job, results)
 
+def filter_results(results, successful: bool = False, failed: bool = False):
+    """Lazily apply the --successful/--failed filters to an iterable of results"""
+    if successful:
+        return (r for r in results if r.get('success'))
+    if failed:
+        return (r for r in results if not r.get('success'))
+    return results
+
+def _trunc(text: str, limit: int = 100) -> str:
+    """Truncate text to limit characters, marking cut text with an ellipsis"""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+def summarize_results(results, sample_size: int = 3):
+    """Count total and successful results in a single pass, keeping the first few successes"""
+    total = successful = 0
+    samples = []
+    for result in results:
+        total += 1
+        if result.get('success'):
+            successful += 1
+            if len(samples) < sample_size:
+                samples.append(result)
+    return total, successful, samples
+
 def display_summary(job: dict, results: list):
     """Display results summary"""
+    job_id = job.get('id', 'N/A')
+    description = job.get('description', 'N/A')
+    status = format_status(job.get('status', 'unknown'))
+    asr = job.get('asr')
+    
     print("\n" + "=" * 60)
-    print(f"Results Summary - Job #{job.get('id', 'N/A')}")
+    print(f"Results Summary - Job #{job_id}")
     print("=" * 60)
     
-    print(f"📝 Description: {job.get('description', 'N/A')}")
-    print(f"Status: {format_status(job.get('status', 'unknown'))}")
+    print(f"📝 Description: {description}")
+    print(f"Status: {status}")
     
     # Calculate statistics
-    total = len(results)
-    successful = sum(1 for r in results if r.get('success'))
+    total, successful, successful_results = summarize_results(results)
     failed = total - successful
     
     print(f"\nStatistics:")
@@ -220,102 +278,133 @@ def display_summary(job: dict, results: list):
     print(f"  Successful: {successful} ({successful/total*100:.1f}%)")
     print(f"  Failed: {failed} ({failed/total*100:.1f}%)")
     
-    if job.get('asr') is not None:
-        print(f"  Overall ASR: {job.get('asr'):.1%}")
+    if asr is not None:
+        print(f"  Overall ASR: {asr:.1%}")
     
     # Show sample of successful attacks
-    successful_results = [r for r in results if r.get('success')]
     if successful_results:
-        print(f"\nSample Successful Attacks ({min(3, len(successful_results))}):")
-        for i, result in enumerate(successful_results[:3], 1):
-            print(f"\n  {i}. Objective: {result.get('objective', 'N/A')[:60]}...")
-            if result.get('payload'):
-                print(f"     Payload: {result.get('payload', '')[:60]}...")
+        print(f"\nSample Successful Attacks ({len(successful_results)}):")
+        for i, result in enumerate(successful_results, 1):
+            get = result.get
+            objective = get('objective', 'N/A')
+            payload = get('payload')
+            print(f"\n  {i}. Objective: {_trunc(objective, 60)}")
+            if payload:
+                print(f"     Payload: {_trunc(payload, 60)}")
 
 def display_full_results(job: dict, results: list):
     """Display full results"""
+    job_id = job.get('id', 'N/A')
+    description = job.get('description', 'N/A')
+    status = format_status(job.get('status', 'unknown'))
+    asr = job.get('asr')
+    
     print("\n" + "=" * 60)
-    print(f"Job Results - #{job.get('id', 'N/A')}")
+    print(f"Job Results - #{job_id}")
     print("=" * 60)
     
-    print(f"📝 Description: {job.get('description', 'N/A')}")
-    print(f"Status: {format_status(job.get('status', 'unknown'))}")
+    print(f"📝 Description: {description}")
+    print(f"Status: {status}")
     
     # Statistics
-    total = len(results)
-    successful = sum(1 for r in results if r.get('success'))
+    total, successful, _ = summarize_results(results, sample_size=0)
     
     print(f"\nStatistics:")
     print(f"  Total: {total} | Success: {successful} ({successful/total*100:.1f}%)")
-    if job.get('asr') is not None:
-        print(f"  ASR: {job.get('asr'):.1%}")
+    if asr is not None:
+        print(f"  ASR: {asr:.1%}")
     
     print(f"\nIndividual Results ({total}):")
     print("-" * 60)
     
+    # Collect output lines and write them in batches rather than one print per line
+    lines = []
     for i, result in enumerate(results, 1):
-        success_icon = "✅" if result.get('success') else "❌"
-        print(f"\n{i}. {success_icon} Result #{i}")
+        get = result.get
+        objective = get('objective', 'N/A')
+        payload = get('payload')
+        output = get('output')
+        trajectory = get('trajectory')
+        
+        success_icon = "✅" if get('success') else "❌"
+        lines.append(f"\n{i}. {success_icon} Result #{i}")
         
         # Objective
-        objective = result.get('objective', 'N/A')
-        if len(objective) > 100:
-            print(f"   Objective: {objective[:100]}...")
-        else:
-            print(f"   Objective: {objective}")
+        lines.append(f"   Objective: {_trunc(objective)}")
         
         # Payload
-        if result.get('payload'):
-            payload = result.get('payload', '')
-            if len(payload) > 100:
-                print(f"   Payload: {payload[:100]}...")
-            else:
-                print(f"   Payload: {payload}")
+        if payload:
+            lines.append(f"   Payload: {_trunc(payload)}")
         
         # Output
-        if result.get('output'):
-            output = result.get('output', '')
-            if len(output) > 100:
-                print(f"   Output: {output[:100]}...")
-            else:
-                print(f"   Output: {output}")
+        if output:
+            lines.append(f"   Output: {_trunc(output)}")
         
         # Trajectory info
-        trajectory = result.get('trajectory', [])
         if trajectory:
-            print(f"   Trajectory: {len(trajectory)} step(s)")
+            lines.append(f"   Trajectory: {len(trajectory)} step(s)")
         
         if i < total:
-            print("   " + "-" * 40)
+            lines.append("   " + "-" * 40)
+        
+        if i % 64 == 0:
+            sys.stdout.write("\n".join(lines) + "\n")
+            lines.clear()
+    
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
-def export_to_csv(job: dict, results: list, output_path: str):
-    """Export results to CSV file"""
+def export_to_csv(job: dict, results, output_path: str):
+    """Export results to CSV file, consuming results as an iterable"""
     print(f"Preparing CSV export...")
     
+    # Peek at the first result so an empty (or fully filtered) job writes no file
+    results = iter(results)
+    try:
+        first = next(results, None)
+    except stream_errors() as e:
+        print(f"Error: {e}")
+        return
+    if first is None:
+        print("Warning: No results found for this job")
+        return
+    results = chain((first,), results)
+    
     # Get job_id - handle both 'job_id' and 'id' field names
     job_id = job.get('job_id', job.get('id', ''))
-    
-    # Prepare data for CSV
-    csv_data = []
-    for result in results:
-        trajectory = result.get('trajectory', [])
-        trajectory_length = len(trajectory) if isinstance(trajectory, list) else 0
-        # Convert trajectory to JSON string for CSV storage
-        trajectory_json = json.dumps(trajectory) if trajectory else ''
-        
-        csv_data.append({
-            'job_id': job_id,
-            'job_description': job.get('description', ''),
-            'job_status': job.get('status', ''),
-            'job_asr': job.get('asr', ''),
-            'objective': result.get('objective', ''),
-            'success': result.get('success', False),
-            'payload': result.get('payload', ''),
-            'output': result.get('output', ''),
-            'trajectory_length': trajectory_length,
-            'trajectory': trajectory_json,
-            'created_at': job.get('created_at', '')
-        })
+    job_description = job.get('description', '')
+    job_status = job.get('status', '')
+    job_asr = job.get('asr', '')
+    created_at = job.get('created_at', '')
+    
+    total = successful = 0
+    
+    # Prepare rows for CSV as they arrive
+    def csv_rows():
+        nonlocal total, successful
+        for result in results:
+            total += 1
+            if result.get('success'):
+                successful += 1
+            
+            trajectory = result.get('trajectory', [])
+            trajectory_length = len(trajectory) if isinstance(trajectory, list) else 0
+            # Convert trajectory to JSON string for CSV storage
+            trajectory_json = json.dumps(trajectory) if trajectory else ''
+            
+            yield {
+                'job_id': job_id,
+                'job_description': job_description,
+                'job_status': job_status,
+                'job_asr': job_asr,
+                'objective': result.get('objective', ''),
+                'success': result.get('success', False),
+                'payload': result.get('payload', ''),
+                'output': result.get('output', ''),
+                'trajectory_length': trajectory_length,
+                'trajectory': trajectory_json,
+                'created_at': created_at
+            }
     
     # Define fieldnames
     fieldnames = [
@@ -333,9 +422,8 @@ def export_to_csv(job: dict, results: list, output_path: str):
     ]
     
     # Save to CSV
-    if save_to_csv(csv_data, output_path, fieldnames):
-        print(f"Exported {len(results)} results")
+    if save_to_csv(csv_rows(), output_path, fieldnames):
+        print(f"Exported {total} results")
         
         # Print summary
-        successful = sum(1 for r in results if r.get('success'))
-        print(f"  Successful: {successful}/{len(results)} ({successful/len(results)*100:.1f}%)")
+        print(f"  Successful: {successful}/{total} ({successful/total*100:.1f}%)")
@@ -1,22 +1,23 @@
 """
 Run command - Execute attack configurations with Rich formatting
+
+Not registered in cli_main.py: `ga-red jobs run` is the CLI entry point, so this
+module is only reachable by importing it.
 """
 
 import argparse
+import os
 import time
-import json
 from pathlib import Path
-from typing import Optional
-from datetime import datetime
-from rich.live import Live
+from typing import Optional, Tuple
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn, BarColumn, TaskProgressColumn
 from utils import (
-    APIClient, load_yaml_config, format_status_plain, print_json,
+    APIClient, load_yaml_config, format_status_plain, format_datetime, print_json, create_table,
     console, print_success, print_error, print_warning, print_info,
-    print_panel, print_yaml, transform_config_for_api
+    print_panel, print_yaml, transform_config_for_api, check_job_config
 )
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 def print_run_help():
     """Print run command help using Rich"""
@@ -27,7 +28,8 @@ def print_run_help():
     ))
     
     console.print("\n[bold]Usage:[/bold]")
-    console.print("  ga-red run [red]<config_file>[/red] [dim][options][/dim]\n")
+    console.print("  ga-red run [red]<config_file>[/red] [dim][options][/dim]")
+    console.print("  ga-red run [red]<directory|glob>[/red] [dim][options][/dim]   Submit several configs at once\n")
     
     console.print("[bold]Options:[/bold]")
     console.print("  --monitor, -m     Monitor job status until completion")
@@ -53,7 +55,7 @@ def add_parser(subparsers):
     
     parser.add_argument(
         'config_file',
-        help='Path to YAML configuration file'
+        help='Path to YAML configuration file (a directory or glob submits several)'
     )
     
     parser.add_argument(
@@ -81,20 +83,47 @@ def add_parser(subparsers):
         help='Output job info as JSON'
     )
 
+def _expand_config_files(config_file: str) -> Optional[list]:
+    """Return the config files a directory or glob pattern refers to, None for a single file"""
+    import glob
+    path = Path(config_file)
+    if path.is_dir():
+        return sorted(str(p) for p in path.iterdir() if p.suffix in ('.yaml', '.yml'))
+    if glob.has_magic(config_file):
+        return sorted(glob.glob(config_file))
+    return None
+
+def _build_payload(config: dict, client: APIClient) -> dict:
+    """Build the /run request body from a loaded YAML config"""
+    transformed = transform_config_for_api(config, client)
+    return {
+        "description": config.get("description", ""),
+        "config": transformed.get("config", {})
+    }
+
 def execute(args):
     """Execute run command"""
-    client = APIClient()
+    # Close pooled connections once the command is done
+    with APIClient() as client:
+        _execute(client, args)
+
+def _execute(client: APIClient, args):
+    """Run the run command with an open client"""
+    config_files = _expand_config_files(args.config_file)
+    if config_files is not None:
+        execute_many(client, config_files, args)
+        return
     
     # Load configuration
     with console.status("[red]Loading configuration...[/red]"):
         config = load_yaml_config(args.config_file)
     
-    if not config:
+    if not config or not check_job_config(config):
         return
     
     # Display config info
     config_info = []
-    config_info.append(f"[bold]File:[/bold] {Path(args.config_file).absolute()}")
+    config_info.append(f"[bold]File:[/bold] {os.path.abspath(args.config_file)}")
     config_info.append(f"[bold]Description:[/bold] {config.get('description', 'N/A')}")
     
     if 'config' in config:
@@ -106,11 +135,7 @@ def execute(args):
     print_panel("\n".join(config_info), title="Configuration Loaded", style="red")
     
     # Transform to new API schema
-    transformed = transform_config_for_api(config, client)
-    payload = {
-        "description": config.get("description", ""),
-        "config": transformed.get("config", {})
-    }
+    payload = _build_payload(config, client)
     
     # Submit job
     console.print("\n[red]Submitting job to server...[/red]")
@@ -142,8 +167,104 @@ def execute(args):
     elif args.wait:
         wait_for_job(client, job_id, args.interval)
 
+def execute_many(client: APIClient, config_files: list, args):
+    """Submit several configs concurrently and report the created jobs"""
+    if not config_files:
+        print_error(f"No configuration files found: {args.config_file}")
+        return
+    
+    configs = []
+    with console.status(f"[red]Loading {len(config_files)} configurations...[/red]"):
+        for config_file in config_files:
+            config = load_yaml_config(config_file)
+            if config and check_job_config(config):
+                configs.append((config_file, config))
+    
+    if not configs:
+        return
+    
+    # Resolve dataset names up front so only the independent POSTs run side by side
+    payloads = [(config_file, _build_payload(config, client)) for config_file, config in configs]
+    
+    def submit(item):
+        config_file, payload = item
+        return config_file, client.post("/run", payload)
+    
+    console.print(f"\n[red]Submitting {len(payloads)} jobs to server...[/red]")
+    with ThreadPoolExecutor(max_workers=min(8, len(payloads))) as pool:
+        submitted = [(config_file, result) for config_file, result in pool.map(submit, payloads) if result]
+    
+    if not submitted:
+        return
+    
+    if args.json:
+        print_json([result for _, result in submitted], title="Jobs Created")
+    else:
+        table = create_table(
+            "Jobs Submitted",
+            ["Config", "Job ID", "Status", "Objectives"],
+            [
+                [config_file, str(result.get('job_id')),
+                 format_status_plain(result.get('status', 'unknown')),
+                 str(result.get('total_objectives') or '-')]
+                for config_file, result in submitted
+            ]
+        )
+        console.print(table)
+    
+    # Monitor or wait if requested
+    if args.monitor or args.wait:
+        monitor_jobs(client, [result.get('job_id') for _, result in submitted], args.interval)
+
+_TERMINAL_STATUSES = ('completed', 'failed', 'error')
+
+def _watch_job(client: APIClient, job_id: int, interval: int):
+    """Yield job snapshots until the job finishes (None if a status check fails).
+    
+    Uses the server's event stream when available and falls back to
+    polling /jobs/{id} every interval seconds otherwise.
+    """
+    events = client.stream_events(f"/jobs/{job_id}/events")
+    if events is not None:
+        for event in events:
+            if event.get('status') in _TERMINAL_STATUSES:
+                yield _final_job(client, job_id, event)
+                return
+            yield event
+    
+    # No event stream (or it closed early): poll instead
+    while True:
+        time.sleep(interval)
+        job = client.get_job_status(job_id)
+        if job and job.get('status') in _TERMINAL_STATUSES:
+            yield _final_job(client, job_id, job)
+            return
+        yield job
+        if not job:
+            return
+
+def _final_job(client: APIClient, job_id: int, snapshot: dict) -> dict:
+    """Complete a terminal status snapshot with the full job record (ASR, timestamps)"""
+    return {**(client.get(f"/jobs/{job_id}") or {}), **snapshot}
+
+def _poll_until_done(client: APIClient, job_id: int, interval: int, on_update, on_done) -> bool:
+    """Pass each job snapshot to on_update and the final one to on_done.
+    
+    Returns False if a status check failed before the job finished.
+    """
+    for job in _watch_job(client, job_id, interval):
+        if not job:
+            print_warning("Failed to get job status")
+            return False
+        on_update(job)
+        if job.get('status') in _TERMINAL_STATUSES:
+            on_done(job)
+            return True
+    return False
+
 def monitor_job(client: APIClient, job_id: int, interval: int):
     """Monitor job status until completion with rich display"""
+    from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn, BarColumn, TaskProgressColumn
     console.print(f"\n[bold red]Monitoring job {job_id}[/bold red]")
     console.print(f"[dim]Checking every {interval} seconds[/dim]")
     console.print("[dim]Press Ctrl+C to stop monitoring[/dim]\n")
@@ -155,13 +276,14 @@ def monitor_job(client: APIClient, job_id: int, interval: int):
         BarColumn(),
         TaskProgressColumn(),
         TimeElapsedColumn(),
-        console=console
+        console=console,
+        refresh_per_second=2
     )
     
     try:
         with progress:
             # Get initial job info to set up progress
-            initial_job = client.get(f"/jobs/{job_id}")
+            initial_job = client.get_job_info(job_id)
             if not initial_job:
                 print_warning("Failed to get initial job status")
                 return
@@ -180,23 +302,21 @@ def monitor_job(client: APIClient, job_id: int, interval: int):
                     total=None
                 )
             
-            while True:
-                time.sleep(interval)
-                
-                # Get job status
-                job = client.get(f"/jobs/{job_id}")
-                if not job:
-                    print_warning("Failed to get job status")
-                    break
-                
+            last_state = None
+            
+            def on_update(job):
+                # Update progress bar only when something changed
+                nonlocal last_state
                 status = job.get('status', 'unknown')
                 completed_objectives = job.get('completed_objectives', 0)
                 total_objectives = job.get('total_objectives', 0)
-                
-                # Update progress bar
+                state = (status, completed_objectives, total_objectives)
+                if state == last_state:
+                    return
+                last_state = state
                 if total_objectives > 0:
                     progress.update(
-                        task, 
+                        task,
                         completed=completed_objectives,
                         description=f"[red]Status: {format_status_plain(status)} [{completed_objectives}/{total_objectives}]"
                     )
@@ -205,37 +325,136 @@ def monitor_job(client: APIClient, job_id: int, interval: int):
                         task,
                         description=f"[red]Status: {format_status_plain(status)}"
                     )
+            
+            def on_done(job):
+                progress.stop()
+                status = job.get('status')
                 
-                # Check if complete
-                if status in ['completed', 'failed', 'error']:
-                    progress.stop()
+                if status == 'completed':
+                    result_info = []
+                    result_info.append(f"[bold green]Job completed successfully[/bold green]")
+                    result_info.append(f"[bold]Objectives completed:[/bold] {job.get('completed_objectives', 0)}/{job.get('total_objectives', 0)}")
+                    if job.get('asr') is not None:
+                        result_info.append(f"[bold]Final ASR:[/bold] {job.get('asr'):.1%}")
+                    result_info.append(f"[bold]Started:[/bold] {format_datetime(job.get('created_at', 'N/A'))}")
+                    result_info.append(f"[bold]Ended:[/bold] {format_datetime(job.get('updated_at', 'N/A'))}")
                     
-                    if status == 'completed':
-                        result_info = []
-                        result_info.append(f"[bold green]Job completed successfully[/bold green]")
-                        result_info.append(f"[bold]Objectives completed:[/bold] {completed_objectives}/{total_objectives}")
-                        if job.get('asr') is not None:
-                            result_info.append(f"[bold]Final ASR:[/bold] {job.get('asr'):.1%}")
-                        result_info.append(f"[bold]Started:[/bold] {format_datetime(job.get('created_at', 'N/A'))}")
-                        result_info.append(f"[bold]Ended:[/bold] {format_datetime(job.get('updated_at', 'N/A'))}")
-                        
-                        print_panel("\n".join(result_info), title="Job Complete", style="green")
-                    else:
-                        print_error(f"Job ended with status: {status}")
-                        console.print(f"[dim]Started: {job.get('created_at', 'N/A')}[/dim]")
-                        console.print(f"[dim]Ended: {job.get('updated_at', 'N/A')}[/dim]")
-                    break
+                    print_panel("\n".join(result_info), title="Job Complete", style="green")
+                else:
+                    print_error(f"Job ended with status: {status}")
+                    console.print(f"[dim]Started: {job.get('created_at', 'N/A')}[/dim]")
+                    console.print(f"[dim]Ended: {job.get('updated_at', 'N/A')}[/dim]")
+            
+            _poll_until_done(client, job_id, interval, on_update, on_done)
                     
     except KeyboardInterrupt:
         console.print("\n[yellow]Monitoring stopped[/yellow]")
         console.print(f"Job {job_id} is still running in the background")
         console.print(f"[dim]Use 'ga-red jobs get {job_id}' to check status[/dim]")
 
+def _fetch_jobs_batch(client: APIClient, job_ids) -> Tuple[Optional[dict], bool]:
+    """Fetch several jobs in one request.
+    
+    Returns (jobs by id, supported): jobs is None when this tick's reply is
+    unusable, and supported is False once the server shows it has no batch endpoint.
+    """
+    response, supported = client.query("/jobs/batch", {"ids": list(job_ids)})
+    if not isinstance(response, (list, dict)):
+        return None, supported
+    records = response if isinstance(response, list) else response.get('jobs', response)
+    if isinstance(records, list):
+        pairs = ((job.get('job_id', job.get('id')), job) for job in records if isinstance(job, dict))
+    elif isinstance(records, dict):
+        # Map of id -> job record or bare status string
+        pairs = ((job_id, job if isinstance(job, dict) else {'status': job}) for job_id, job in records.items())
+    else:
+        return None, supported
+    # Reply ids may be strings; key the jobs by the pending ids they match
+    ids = {str(job_id): job_id for job_id in job_ids}
+    jobs = {ids[str(key)]: job for key, job in pairs if str(key) in ids}
+    return jobs or None, supported
+
+def monitor_jobs(client: APIClient, job_ids: list, interval: int):
+    """Monitor several jobs until all complete, with one progress bar per job"""
+    from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn, BarColumn, TaskProgressColumn
+    console.print(f"\n[bold red]Monitoring {len(job_ids)} jobs[/bold red]")
+    console.print(f"[dim]Checking every {interval} seconds[/dim]")
+    console.print("[dim]Press Ctrl+C to stop monitoring[/dim]\n")
+    
+    progress = Progress(
+        SpinnerColumn(style="red"),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TaskProgressColumn(),
+        TimeElapsedColumn(),
+        console=console,
+        refresh_per_second=2
+    )
+    
+    pending = list(job_ids)
+    finished = {}
+    last_states = {}
+    use_batch = True
+    
+    try:
+        with progress, ThreadPoolExecutor(max_workers=min(8, len(job_ids))) as pool:
+            tasks = {job_id: progress.add_task(f"[red]Job {job_id}", total=None) for job_id in job_ids}
+            
+            while pending:
+                # One batch request per tick; fall back to concurrent per-job requests
+                # for this tick, and for good once the server lacks the endpoint
+                jobs = None
+                if use_batch:
+                    jobs, use_batch = _fetch_jobs_batch(client, pending)
+                if jobs is None:
+                    jobs = dict(zip(pending, pool.map(client.get_job_status, pending)))
+                if not any(jobs.values()):
+                    print_warning("Failed to get job status")
+                    break
+                
+                for job_id in list(pending):
+                    job = jobs.get(job_id)
+                    if not job:
+                        continue
+                    
+                    status = job.get('status', 'unknown')
+                    completed_objectives = job.get('completed_objectives', 0)
+                    total_objectives = job.get('total_objectives', 0)
+                    state = (status, completed_objectives, total_objectives)
+                    if last_states.get(job_id) != state:
+                        last_states[job_id] = state
+                        progress.update(
+                            tasks[job_id],
+                            total=total_objectives or None,
+                            completed=completed_objectives,
+                            description=f"[red]Job {job_id}: {format_status_plain(status)} [{completed_objectives}/{total_objectives}]"
+                        )
+                    
+                    if status in _TERMINAL_STATUSES:
+                        pending.remove(job_id)
+                        finished[job_id] = job
+                
+                if pending:
+                    time.sleep(interval)
+                    
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Monitoring stopped[/yellow]")
+        console.print(f"Jobs still running in the background: {', '.join(map(str, pending))}")
+        return
+    
+    for job_id, job in finished.items():
+        if job.get('status') == 'completed':
+            asr = f" (ASR: {job['asr']:.1%})" if job.get('asr') is not None else ""
+            print_success(f"Job {job_id} completed successfully{asr}")
+        else:
+            print_error(f"Job {job_id} ended with status: {job.get('status')}")
+
 def wait_for_job(client: APIClient, job_id: int, interval: int):
     """Wait for job completion with progress tracking"""
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
     
     # Get initial job info
-    initial_job = client.get(f"/jobs/{job_id}")
+    initial_job = client.get_job_info(job_id)
     if not initial_job:
         print_warning("Failed to get job status")
         return
@@ -248,7 +467,8 @@ def wait_for_job(client: APIClient, job_id: int, interval: int):
         TextColumn("[progress.description]{task.description}"),
         BarColumn(),
         TaskProgressColumn(),
-        console=console
+        console=console,
+        refresh_per_second=2
     )
     
     with progress:
@@ -263,44 +483,27 @@ def wait_for_job(client: APIClient, job_id: int, interval: int):
                 total=None
             )
         
+        last_completed = None
+        
+        def on_update(job):
+            # Update progress only when it moved
+            nonlocal last_completed
+            completed_objectives = job.get('completed_objectives', 0)
+            if total_objectives > 0 and completed_objectives != last_completed:
+                progress.update(task, completed=completed_objectives)
+                last_completed = completed_objectives
+        
+        def on_done(job):
+            job_status = job.get('status')
+            if job_status == 'completed':
+                print_success(f"Job {job_id} completed successfully")
+                if job.get('asr') is not None:
+                    console.print(f"[bold]ASR:[/bold] {job.get('asr'):.1%}")
+            else:
+                print_error(f"Job {job_id} ended with status: {job_status}")
+        
         try:
-            while True:
-                time.sleep(interval)
-                
-                # Get job status
-                job = client.get(f"/jobs/{job_id}")
-                if not job:
-                    print_warning("Failed to get job status")
-                    break
-                
-                job_status = job.get('status', 'unknown')
-                completed_objectives = job.get('completed_objectives', 0)
-                
-                # Update progress
-                if total_objectives > 0:
-                    progress.update(task, completed=completed_objectives)
-                
-                # Check if complete
-                if job_status in ['completed', 'failed', 'error']:
-                    if job_status == 'completed':
-                        print_success(f"Job {job_id} completed successfully")
-                        if job.get('asr') is not None:
-                            console.print(f"[bold]ASR:[/bold] {job.get('asr'):.1%}")
-                    else:
-                        print_error(f"Job {job_id} ended with status: {job_status}")
-                    break
-                    
+            _poll_until_done(client, job_id, interval, on_update, on_done)
         except KeyboardInterrupt:
             console.print("\n[yellow]Wait cancelled[/yellow]")
             console.print(f"Job {job_id} is still running in the background")
-
-def format_datetime(dt_str: str) -> str:
-    """Format ISO datetime string to readable format"""
-    try:
-        from datetime import datetime
-        dt = datetime.fromisoformat(dt_str.replace('Z', '+00:00'))
-        return dt.strftime("%Y-%m-%d %H:%M:%S")
-    except:
-        return dt_str
-
-# Fix missing import
@@ -10,25 +10,34 @@ Example:
     python run_job.py configs/tap_basic.yaml
 """
 
-import yaml
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import sys
 import argparse
 import time
 import csv
-from pathlib import Path
-import dotenv
 import os
 from datetime import datetime
 
-# Load environment variables
-dotenv.load_dotenv()
-
 def print_usage():
     """Print usage information"""
     print(__doc__)
 
+def create_session(api_key: str) -> requests.Session:
+    """Create an HTTP session that reuses connections across requests"""
+    session = requests.Session()
+    session.headers.update({"Authorization": f"Bearer {api_key}"})
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=4,
+        max_retries=Retry(total=3, backoff_factor=0.3)
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
 def run_job(config_path: str, monitor: bool = False):
     """
     Run a job from a configuration file
@@ -37,24 +46,33 @@ def run_job(config_path: str, monitor: bool = False):
         config_path: Path to the YAML configuration file
         monitor: If True, monitor job status until completion
     """
-    # Convert to Path object
-    config_file = Path(config_path)
+    from utils import load_env, validate_job_config, json_loads, yaml_load
+    
+    # Load environment variables (only needed here, for GA_KEY/REDIT_API_URL)
+    load_env()
     
     # Check if file exists
-    if not config_file.exists():
+    if not os.path.exists(config_path):
         print(f"❌ Error: Configuration file '{config_path}' not found")
         sys.exit(1)
     
     # Read the configuration
     try:
-        with open(config_file, 'r') as f:
-            config = yaml.safe_load(f)
+        with open(config_path, 'r') as f:
+            config = yaml_load(f)
     except Exception as e:
         print(f"❌ Error reading configuration file: {e}")
         sys.exit(1)
     
+    # Catch malformed configs locally instead of after a round trip to the server
+    errors = validate_job_config(config)
+    if errors:
+        for error in errors:
+            print(f"❌ Invalid configuration: {error}")
+        sys.exit(1)
+    
     print("✅ Configuration loaded successfully!")
-    print(f"📄 Config file: {config_file}")
+    print(f"📄 Config file: {config_path}")
     print(f"📝 Description: {config.get('description', 'N/A')}")
     
     if 'config' in config:
@@ -73,22 +91,22 @@ def run_job(config_path: str, monitor: bool = False):
         sys.exit(1)
     
     # Prepare the API request
-    api_url = os.environ.get("REDIT_API_URL", "https://art-server.generalanalysis.com") + "/run"
+    base_url = os.environ.get("REDIT_API_URL", "https://art-server.generalanalysis.com")
+    api_url = base_url + "/run"
     
     payload = {
         "description": config.get("description", ""),
         "config": config.get("config", {})
     }
     
-    headers = {
-        "Authorization": f"Bearer {api_key}"
-    }
+    # Reuse one connection for the submission and all status checks
+    session = create_session(api_key)
     
     # Make the API call
     print(f"🚀 Sending request to REDit server at {api_url}...")
     
     try:
-        response = requests.post(api_url, json=payload, headers=headers)
+        response = session.post(api_url, json=payload)
     except requests.exceptions.ConnectionError:
         print("❌ Error: Could not connect to REDit server")
         print("Make sure the server is running and accessible")
@@ -99,7 +117,7 @@ def run_job(config_path: str, monitor: bool = False):
     
     # Check the response
     if response.status_code == 200:
-        result = response.json()
+        result = json_loads(response.content)
         print("✅ Attack job created successfully!")
         print(json.dumps(result, indent=2))
         
@@ -114,12 +132,11 @@ def run_job(config_path: str, monitor: bool = False):
                 time.sleep(5)  # Wait 5 seconds between checks
                 
                 try:
-                    base_url = os.environ.get("REDIT_API_URL", "https://art-server.generalanalysis.com")
                     status_url = f"{base_url}/jobs/{job_id}"
-                    status_response = requests.get(status_url, headers=headers)
+                    status_response = session.get(status_url)
                     
                     if status_response.status_code == 200:
-                        status_data = status_response.json()
+                        status_data = json_loads(status_response.content)
                         current_time = datetime.now().strftime("%H:%M:%S")
                         status = status_data.get('status', 'unknown')
                         
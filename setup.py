@@ -16,6 +16,10 @@ setup(
     packages=find_packages(),
     py_modules=["cli_main", "utils", "run_job"],
     install_requires=requirements,
+    extras_require={
+        # Optional accelerators; the CLI falls back to the standard library without them
+        "speedups": ["ijson>=3.1", "orjson>=3.0"],
+    },
     python_requires=">=3.8",
     entry_points={
         "console_scripts": [
@@ -5,197 +5,653 @@ Shared utilities for REDit CLI with Rich formatting
 import os
 import sys
 import json
-import requests
+import time
+import functools
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Callable
+from typing import Dict, Any, Optional, List, Callable, Iterable, Iterator, Tuple, BinaryIO, TYPE_CHECKING
 from datetime import datetime
-import dotenv
-import readchar
 
+# requests, dotenv and the rich modules used by a single helper are imported
+# where they are needed, so commands that never use them start faster
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.syntax import Syntax
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
-from rich.prompt import Confirm
-from rich import print as rprint
-from rich.text import Text
-from rich.json import JSON
-from rich.live import Live
 from rich.style import Style
+from rich.text import Text
+
+if TYPE_CHECKING:
+    from rich.progress import Progress
 
-# Load environment variables
-dotenv.load_dotenv()
+_ENV_LOADED = False
+
+def load_env():
+    """Load environment variables from the nearest .env file, once per process"""
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+    _ENV_LOADED = True
+    import dotenv
+    env_file = dotenv.find_dotenv()
+    if env_file:
+        dotenv.load_dotenv(env_file)
 
 # Create global console instance
 console = Console()
 
+def debug(message: str):
+    """Print a dim diagnostic line when REDIT_DEBUG is set"""
+    if os.environ.get("REDIT_DEBUG"):
+        console.print(f"[dim]{message}[/dim]")
+
+# Job fields that never change after submission
+JOB_STATIC_FIELDS = ('job_id', 'id', 'description', 'config', 'created_at', 'total_objectives')
+
+# (connect, read) timeouts in seconds for API requests; post() waits without a read timeout
+REQUEST_TIMEOUT = (3.05, 30)
+
+def _retry_policy():
+    """Retry transient failures on the pooled connection before surfacing an error.
+    
+    Connection failures are retried for every method since nothing reached the
+    server; read errors and retryable statuses only for idempotent methods, so a
+    POST /run is never submitted twice. Retry-After is honoured on 429/503.
+    """
+    from urllib3.util.retry import Retry
+    return Retry(
+        total=3,
+        connect=2,
+        read=2,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD", "DELETE"}),
+        backoff_factor=0.3,
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+
+# How long get_cached reuses a listing response, in seconds
+CACHE_TTL = 30.0
+# Responses larger than this (or of unknown length) are parsed incrementally by iter_items
+STREAM_MIN_BYTES = 256 * 1024
+
+# Where get(..., cache=True) keeps ETag-validated responses between runs
+CACHE_DIR = Path("~/.cache/redit").expanduser()
+
+# orjson parses API payloads several times faster than json; it is optional.
+# Output is always written with json.dumps so it is the same in every install.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def json_loads(data: Any) -> Any:
+    """Decode JSON from bytes or str, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def yaml_load(stream: Any) -> Any:
+    """Safely parse YAML, with the libyaml-backed loader when PyYAML was built with it"""
+    import yaml
+    return yaml.load(stream, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+
+def yaml_dump(data: Any, stream: Any = None) -> Optional[str]:
+    """Safely dump YAML in block style keeping key order, with libyaml when available.
+    
+    Returns the text, or None when written to stream.
+    """
+    import yaml
+    return yaml.dump(
+        data, stream, Dumper=getattr(yaml, 'CSafeDumper', yaml.SafeDumper),
+        default_flow_style=False, sort_keys=False
+    )
+
+def _print_request_error(error: Any, detail: str = ""):
+    """Report a failed request in a single print; detail (e.g. a response body) is shown verbatim"""
+    console.print(Text.assemble((f"Error: {error}", "red"), f"\n{detail}" if detail else ""))
+
+# Statuses meaning an optional endpoint does not exist: 405 where the path
+# matches another route, such as /jobs/{job_id}
+_UNSUPPORTED_STATUSES = (404, 405)
+
+# Writes whose endpoint is not under the listing they change
+_WRITE_LISTINGS = {"/run": "/jobs"}
+
+def _affected_listing(endpoint: str) -> str:
+    """Return the cached listing a POST or DELETE to endpoint changes, e.g. /jobs for /jobs/3"""
+    return _WRITE_LISTINGS.get(endpoint, "/" + endpoint.lstrip("/").split("/", 1)[0])
+
+def stream_errors() -> Tuple[type, ...]:
+    """Exceptions a streamed JSON body can raise while it is being consumed"""
+    import requests
+    import urllib3
+    errors = (ValueError, requests.exceptions.RequestException, urllib3.exceptions.HTTPError)
+    try:
+        import ijson
+    except ImportError:
+        return errors
+    return errors + (ijson.JSONError,)
+
 class APIClient:
     """Client for interacting with REDit server API"""
     
-    def __init__(self, base_url: str = None, api_key: str = None):
+    def __init__(self, base_url: str = None, api_key: str = None, cache_ttl: float = CACHE_TTL):
         """Initialize API client
         
         Args:
             base_url: Base URL for the API (default: https://art-server.generalanalysis.com)
             api_key: API key for authentication (default: from GA_KEY env var)
+            cache_ttl: Seconds get_cached reuses a response in memory (0 always revalidates)
         """
+        import requests
+        from requests.adapters import HTTPAdapter
+        
+        # Environment variables may come from a .env file
+        load_env()
+        
         self.base_url = base_url or os.environ.get("REDIT_API_URL", "https://art-server.generalanalysis.com")
-        print(self.base_url)
+        debug(f"API: {self.base_url}")
         self.api_key = api_key or os.environ.get("GA_KEY")
         
         if not self.api_key:
-            console.print("[yellow]Warning: GA_KEY environment variable not set[/yellow]")
-            console.print("Set it with: [cyan]export GA_KEY=your_api_key[/cyan]")
+            console.print(
+                "[yellow]Warning: GA_KEY environment variable not set[/yellow]\n"
+                "Set it with: [cyan]export GA_KEY=your_api_key[/cyan]"
+            )
+        
+        self.headers = {"Accept": "application/json"}
+        if self.api_key:
+            self.headers["Authorization"] = f"Bearer {self.api_key}"
+        
+        # One session for the client's lifetime so requests reuse pooled keep-alive connections;
+        # its default headers are merged into every request, so no call passes headers itself
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=_retry_policy()
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         
-        self.headers = {
-            "Authorization": f"Bearer {self.api_key}" if self.api_key else ""
-        }
+        # Immutable job fields by job id, and whether /jobs/{id}/status exists
+        self._job_info: Dict[Any, Dict[str, Any]] = {}
+        self._status_endpoint = True
+        
+        # Recent listing responses by endpoint: (time.monotonic() when fetched, response)
+        self.cache_ttl = cache_ttl
+        self._get_cache: Dict[str, Tuple[float, Any]] = {}
+        # Casefolded dataset name -> id, with the /datasets response it was built from
+        self._ds_name_index: Optional[Tuple[Any, Dict[str, Any]]] = None
     
-    def get(self, endpoint: str) -> Optional[Dict[str, Any]]:
-        """Make GET request to API"""
-        url = f"{self.base_url}{endpoint}"
+    def _request(self, method: str, endpoint: str, ok: Tuple[int, ...] = (200,),
+                 missing_ok: bool = False, quiet: bool = False, **kwargs):
+        """Send a request on the pooled session and return the response if its status is in ok.
+        
+        Every failure yields None: a 404 with missing_ok and any status with
+        quiet silently, connection errors and other statuses with one error print.
+        """
+        import requests
+        kwargs.setdefault("timeout", REQUEST_TIMEOUT)
         try:
-            response = requests.get(url, headers=self.headers)
-            if response.status_code == 200:
-                return response.json()
-            else:
-                console.print(f"[red]Error: {response.status_code}[/red]")
-                console.print(response.text)
-                return None
+            response = self.session.request(method, f"{self.base_url}{endpoint}", **kwargs)
         except requests.exceptions.ConnectionError:
-            console.print(f"[red]Error: Could not connect to {self.base_url}[/red]")
-            console.print("[yellow]Make sure the REDit server is running[/yellow]")
+            console.print(Text.assemble(
+                (f"Error: Could not connect to {self.base_url}", "red"),
+                ("\nMake sure the REDit server is running", "yellow")
+            ))
             return None
-        except Exception as e:
-            console.print(f"[red]Error: {e}[/red]")
+        except requests.exceptions.RequestException as e:
+            _print_request_error(e)
             return None
+        if response.status_code in ok:
+            return response
+        if not quiet and not (missing_ok and response.status_code == 404):
+            _print_request_error(response.status_code, response.text)
+        response.close()
+        return None
     
-    def post(self, endpoint: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Make POST request to API"""
-        url = f"{self.base_url}{endpoint}"
+    @staticmethod
+    def _parse(response) -> Any:
+        """Decode a JSON response body straight from its bytes, reporting a malformed one"""
         try:
-            response = requests.post(url, json=data, headers=self.headers)
-            if response.status_code in [200, 201]:  # Accept both 200 and 201 for successful creation
-                return response.json()
-            else:
-                console.print(f"[red]Error: {response.status_code}[/red]")
-                console.print(response.text)
-                return None
-        except requests.exceptions.ConnectionError:
-            console.print(f"[red]Error: Could not connect to {self.base_url}[/red]")
-            console.print("[yellow]Make sure the REDit server is running[/yellow]")
+            return json_loads(response.content)
+        except ValueError as e:
+            _print_request_error(e)
             return None
-        except Exception as e:
-            console.print(f"[red]Error: {e}[/red]")
+    
+    def close(self):
+        """Close the client's pooled connections"""
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def get(self, endpoint: str, missing_ok: bool = False, cache: bool = False) -> Optional[Dict[str, Any]]:
+        """Make GET request to API (missing_ok: return None quietly on 404).
+        
+        With cache=True the response is stored on disk with its ETag and
+        revalidated with If-None-Match, so an unchanged resource is not
+        downloaded again.
+        """
+        cached = self._read_cache(endpoint) if cache else None
+        response = self._request(
+            "GET", endpoint, ok=(200, 304) if cached else (200,), missing_ok=missing_ok,
+            headers={"If-None-Match": cached["etag"]} if cached else None
+        )
+        if response is None:
             return None
+        if response.status_code == 304:
+            return cached["body"]
+        body = self._parse(response)
+        if body is not None and cache and response.headers.get("ETag"):
+            self._write_cache(endpoint, response.headers["ETag"], body)
+        return body
+    
+    def _cache_path(self, endpoint: str) -> Path:
+        """Disk cache file for an endpoint, separate per server and API key"""
+        import hashlib
+        key = f"{self.base_url}\n{self.api_key or ''}\n{endpoint}"
+        return CACHE_DIR / hashlib.sha1(key.encode()).hexdigest()
+    
+    def _read_cache(self, endpoint: str) -> Optional[Dict[str, Any]]:
+        """Return the cached {"etag", "body"} entry for an endpoint, if any"""
+        try:
+            with open(self._cache_path(endpoint), 'rb') as f:
+                entry = json_loads(f.read())
+        except (OSError, ValueError):
+            return None
+        return entry if isinstance(entry, dict) and entry.get("etag") else None
+    
+    def _write_cache(self, endpoint: str, etag: str, body: Any):
+        """Atomically store a response and its ETag; caching is best effort"""
+        import tempfile
+        tmp_name = None
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile('w', dir=CACHE_DIR, delete=False, encoding='utf-8') as f:
+                tmp_name = f.name
+                json.dump({"etag": etag, "body": body}, f)
+            os.replace(tmp_name, self._cache_path(endpoint))
+        except (OSError, TypeError, ValueError):
+            debug(f"Could not write response cache for {endpoint}")
+            if tmp_name and os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+    
+    def post(self, endpoint: str, data: Dict[str, Any], missing_ok: bool = False) -> Optional[Dict[str, Any]]:
+        """Make POST request to API (missing_ok: return None quietly on 404)"""
+        self.invalidate(_affected_listing(endpoint))
+        # Accept both 200 and 201 for successful creation. No read timeout: the
+        # server may still create the job after we give up, and a retry duplicates it.
+        response = self._request("POST", endpoint, ok=(200, 201), missing_ok=missing_ok,
+                                 timeout=(REQUEST_TIMEOUT[0], None), json=data)
+        return self._parse(response) if response is not None else None
+    
+    def query(self, endpoint: str, data: Dict[str, Any]) -> Tuple[Optional[Any], bool]:
+        """POST a read-only query, leaving cached listings alone.
+        
+        Returns (body, supported): body is None on any failure, which is reported
+        quietly; supported is False only if the server has no such endpoint.
+        """
+        response = self._request("POST", endpoint, ok=(200,) + _UNSUPPORTED_STATUSES, quiet=True, json=data)
+        if response is None:
+            return None, True
+        if response.status_code in _UNSUPPORTED_STATUSES:
+            return None, False
+        return self._parse(response), True
     
     def delete(self, endpoint: str) -> bool:
         """Make DELETE request to API"""
-        url = f"{self.base_url}{endpoint}"
-        try:
-            response = requests.delete(url, headers=self.headers)
-            return response.status_code == 200
-        except Exception as e:
-            console.print(f"[red]Error: {e}[/red]")
+        self.invalidate(_affected_listing(endpoint))
+        # Callers report a failed delete themselves
+        return self._request("DELETE", endpoint, quiet=True) is not None
+
+    def download(self, endpoint: str, sink: BinaryIO, chunk_size: int = 1 << 16) -> bool:
+        """Stream a GET response body into a binary file-like sink, chunk by chunk"""
+        import requests
+        response = self._request("GET", endpoint, stream=True)
+        if response is None:
             return False
+        with response:
+            try:
+                for chunk in response.iter_content(chunk_size):
+                    sink.write(chunk)
+            except requests.exceptions.RequestException as e:
+                _print_request_error(e)
+                return False
+        return True
 
     def get_bytes(self, endpoint: str) -> Optional[bytes]:
-        """GET request that returns raw bytes (for downloads)."""
+        """GET request that returns raw bytes (for small downloads; use download() for large ones)."""
+        from io import BytesIO
+        
+        buffer = BytesIO()
+        if not self.download(endpoint, buffer):
+            return None
+        return buffer.getvalue()
+
+    def get_cached(self, endpoint: str, ttl: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """GET an idempotent endpoint, reusing a successful response younger than ttl seconds.
+        
+        ttl defaults to the client's cache_ttl. Older responses are revalidated
+        against the disk cache by ETag.
+        """
+        if ttl is None:
+            ttl = self.cache_ttl
+        cached = self._get_cache.get(endpoint)
+        now = time.monotonic()
+        if cached and now - cached[0] < ttl:
+            return cached[1]
+        response = self.get(endpoint, cache=True)
+        if response is not None:
+            self._get_cache[endpoint] = (now, response)
+        return response
+    
+    def invalidate(self, endpoint: Optional[str] = None):
+        """Forget the cached responses for endpoint and anything below it, or every cached response"""
+        if endpoint is None:
+            self._get_cache.clear()
+        else:
+            for key in list(self._get_cache):
+                if key == endpoint or key.startswith(endpoint + "/"):
+                    self._get_cache.pop(key, None)
+        if endpoint in (None, "/datasets"):
+            self._ds_name_index = None
+    
+    def get_dataset_name_index(self) -> Optional[Dict[str, Any]]:
+        """Map casefolded dataset names to ids (None if /datasets cannot be fetched)"""
+        response = self.get_cached("/datasets")
+        if response is None:
+            return None
+        # Read the memo once: another thread's write may reset it meanwhile
+        memo = self._ds_name_index
+        if memo is not None and memo[0] is response:
+            return memo[1]
+        datasets = response if isinstance(response, list) else response.get('datasets', [])
+        index = {}
+        for ds in datasets:
+            if ds.get('name') and ds.get('id') is not None:
+                # First dataset with a given name wins, as with a linear scan
+                index.setdefault(str(ds['name']).casefold(), ds['id'])
+        self._ds_name_index = (response, index)
+        return index
+    
+    def get_many(self, endpoints: List[str], cached: bool = False) -> Dict[str, Any]:
+        """GET several endpoints concurrently, returning each response keyed by endpoint"""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        fetch = self.get_cached if cached else self.get
+        if len(endpoints) < 2:
+            return {endpoint: fetch(endpoint) for endpoint in endpoints}
+        with ThreadPoolExecutor(max_workers=min(8, len(endpoints))) as pool:
+            return dict(zip(endpoints, pool.map(fetch, endpoints)))
+
+    def get_job_info(self, job_id: Any) -> Dict[str, Any]:
+        """Return a job's immutable fields, fetching the job at most once per client"""
+        if job_id not in self._job_info:
+            job = self.get(f"/jobs/{job_id}")
+            if not job:
+                return {}
+            self._remember_job(job_id, job)
+        return self._job_info[job_id]
+    
+    def get_job_status(self, job_id: Any) -> Optional[Dict[str, Any]]:
+        """Fetch a job's current status for polling.
+        
+        Uses the lightweight /jobs/{id}/status endpoint (status and progress only)
+        when the server provides it, merged over the cached immutable fields, and
+        the full job record otherwise. Only a 404/405 turns the probe off; other
+        failures fall back for this call and retry the probe next time.
+        """
+        if self._status_endpoint:
+            response = self._request(
+                "GET", f"/jobs/{job_id}/status",
+                ok=(200,) + _UNSUPPORTED_STATUSES, quiet=True
+            )
+            if response is not None and response.status_code in _UNSUPPORTED_STATUSES:
+                response.close()
+                self._status_endpoint = False
+            elif response is not None:
+                status = self._parse(response)
+                if isinstance(status, dict):
+                    return {**self.get_job_info(job_id), **status}
+
+        job = self.get(f"/jobs/{job_id}")
+        if job:
+            self._remember_job(job_id, job)
+        return job
+    
+    def _remember_job(self, job_id: Any, job: Dict[str, Any]):
+        """Cache the fields of a job record that do not change while it runs"""
+        self._job_info[job_id] = {key: job[key] for key in JOB_STATIC_FIELDS if key in job}
+    
+    def iter_items(self, endpoint: str, item_path: str) -> Optional[Iterator[Any]]:
+        """Iterate over the items of a JSON array in a GET response.
+        
+        item_path uses ijson prefix syntax (e.g. 'results.item'). When ijson is
+        installed, bodies larger than STREAM_MIN_BYTES (or of unknown length)
+        are parsed incrementally as they download; others are parsed in full.
+        Returns None if the request fails; errors while the body is consumed
+        (see stream_errors) propagate from the iterator.
+        """
+        response = self._request("GET", endpoint, stream=True)
+        if response is None:
+            return None
+        return self._iter_json_items(response, item_path)
+    
+    @staticmethod
+    def _iter_json_items(response, item_path: str) -> Iterator[Any]:
+        """Yield items at item_path from a streamed response"""
+        with response:
+            try:
+                import ijson
+            except ImportError:
+                ijson = None
+            # Bodies known to be small parse faster in one go than incrementally
+            length = response.headers.get('Content-Length', '')
+            if ijson is None or (length.isdigit() and int(length) <= STREAM_MIN_BYTES):
+                data = json_loads(response.content)
+                for key in item_path.split('.')[:-1]:
+                    data = data.get(key, []) if isinstance(data, dict) else []
+                yield from data
+                return
+            # Let urllib3 undo any gzip/deflate encoding before ijson reads the body
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, item_path, use_float=True)
+    
+    def stream_events(self, endpoint: str) -> Optional[Iterator[Dict[str, Any]]]:
+        """Open a server-sent event stream of JSON objects.
+        
+        Returns None if the server does not offer the stream, so callers can
+        fall back to polling. The iterator ends when the server closes the stream.
+        """
         url = f"{self.base_url}{endpoint}"
         try:
-            response = requests.get(url, headers=self.headers)
-            if response.status_code == 200:
-                return response.content
-            else:
-                console.print(f"[red]Error: {response.status_code}[/red]")
-                console.print(response.text)
-                return None
-        except requests.exceptions.ConnectionError:
-            console.print(f"[red]Error: Could not connect to {self.base_url}[/red]")
-            console.print("[yellow]Make sure the REDit server is running[/yellow]")
+            # No read timeout: the stream may stay quiet for a long time between updates
+            response = self.session.get(
+                url, stream=True, timeout=(REQUEST_TIMEOUT[0], None),
+                headers={"Accept": "text/event-stream"}
+            )
+        except Exception:
             return None
-        except Exception as e:
-            console.print(f"[red]Error: {e}[/red]")
+        if response.status_code != 200:
+            response.close()
             return None
+        return self._iter_events(response)
+    
+    @staticmethod
+    def _iter_events(response) -> Iterator[Dict[str, Any]]:
+        """Yield JSON payloads from an SSE or JSON-lines response"""
+        import requests
+        with response:
+            try:
+                for line in response.iter_lines(decode_unicode=True):
+                    # Accept both SSE "data:" frames and bare JSON lines
+                    if line.startswith('data:'):
+                        line = line[5:].strip()
+                    if not line.startswith('{'):
+                        continue
+                    try:
+                        yield json_loads(line)
+                    except ValueError:
+                        continue
+            except requests.exceptions.RequestException:
+                return
 
+# Output format for format_datetime
+_FMT = "%Y-%m-%d %H:%M:%S"
+
+@functools.lru_cache(maxsize=4096)
 def format_datetime(dt_str: str) -> str:
-    """Format ISO datetime string to readable format"""
+    """Format ISO datetime string to readable format (memoized; listings repeat timestamps)"""
     try:
-        dt = datetime.fromisoformat(dt_str.replace('Z', '+00:00'))
-        return dt.strftime("%Y-%m-%d %H:%M:%S")
+        # Server timestamps are 'YYYY-MM-DDTHH:MM:SS[.ffffff][Z|±HH:MM]', which
+        # already hold the output fields in order; splice them without parsing
+        if (len(dt_str) >= 19 and dt_str[4] == '-' and dt_str[7] == '-' and dt_str[10] == 'T'
+                and dt_str[13] == ':' and dt_str[16] == ':'):
+            return f"{dt_str[:10]} {dt_str[11:19]}"
+        iso_str = dt_str
+        # Only a trailing 'Z' needs rewriting for fromisoformat
+        if iso_str.endswith('Z'):
+            iso_str = iso_str[:-1] + '+00:00'
+        dt = datetime.fromisoformat(iso_str)
+        return dt.strftime(_FMT)
     except:
         return dt_str
 
+# Display text and color for each known job status
+_STATUS_STYLES = {
+    'pending': ('Pending', 'yellow'),
+    'running': ('Running', 'cyan'),
+    'completed': ('Completed', 'green'),
+    'failed': ('Failed', 'red'),
+    'error': ('Error', 'red')
+}
+
+_STATUS_MAP = {status: text for status, (text, _) in _STATUS_STYLES.items()}
+
 def format_status(status: str) -> Text:
     """Format status with color"""
-    status_styles = {
-        'pending': ('Pending', 'yellow'),
-        'running': ('Running', 'cyan'),
-        'completed': ('Completed', 'green'),
-        'failed': ('Failed', 'red'),
-        'error': ('Error', 'red')
-    }
-    
-    text, color = status_styles.get(status, (status.title(), 'white'))
-    return Text(text, style=color)
+    entry = _STATUS_STYLES.get(status)
+    if entry is None:
+        return Text(status.title(), style='white')
+    return Text(entry[0], style=entry[1])
 
+@functools.lru_cache(maxsize=32)
 def format_status_plain(status: str) -> str:
     """Format status for display"""
-    status_map = {
-        'pending': 'Pending',
-        'running': 'Running',
-        'completed': 'Completed',
-        'failed': 'Failed',
-        'error': 'Error'
-    }
-    return status_map.get(status, status.title())
+    text = _STATUS_MAP.get(status)
+    return text if text is not None else status.title()
 
 def print_json(data: Any, title: str = None):
     """Pretty print JSON data with Rich"""
+    from rich.json import JSON
     if title:
-        console.print(Panel(JSON(json.dumps(data)), title=title, expand=False))
+        console.print(Panel(JSON.from_data(data), title=title, expand=False))
     else:
-        console.print(JSON(json.dumps(data)))
+        console.print(JSON.from_data(data))
 
 def confirm_action(message: str) -> bool:
     """Ask user for confirmation using Rich prompt"""
+    from rich.prompt import Confirm
     return Confirm.ask(message)
 
 def load_yaml_config(file_path: str) -> Optional[Dict[str, Any]]:
     """Load YAML configuration file"""
-    import yaml
-    
-    config_file = Path(file_path)
-    if not config_file.exists():
+    if not os.path.isfile(file_path):
         console.print(f"[red]Error: Configuration file '{file_path}' not found[/red]")
         return None
     
     try:
-        with open(config_file, 'r') as f:
-            return yaml.safe_load(f)
+        with open(file_path, 'r') as f:
+            return yaml_load(f)
     except Exception as e:
         console.print(f"[red]Error reading configuration file: {e}[/red]")
         return None
 
-def save_to_csv(data: list, output_path: str, fieldnames: list):
-    """Save data to CSV file"""
+# Fields a job config needs before the server will accept it; the target
+# model may be given either as config.target or the legacy config.models.target
+_REQUIRED_CONFIG_FIELDS = (
+    ('description',),
+    ('config.attack.type',),
+    ('config.target.name', 'config.models.target.name'),
+)
+
+def _lookup(data: Any, path: str) -> Any:
+    """Follow a dotted path through nested dicts, None if any part is missing"""
+    for key in path.split('.'):
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+def validate_job_config(config: Any) -> List[str]:
+    """Check a loaded job config locally, returning one message per problem found"""
+    if not isinstance(config, dict):
+        return ["configuration must be a mapping"]
+    
+    errors = []
+    for paths in _REQUIRED_CONFIG_FIELDS:
+        values = [_lookup(config, path) for path in paths]
+        if not any(values):
+            errors.append(f"{' or '.join(paths)} is required")
+        elif not any(isinstance(value, str) for value in values):
+            errors.append(f"{' or '.join(paths)} must be a string")
+    return errors
+
+def check_job_config(config: Any) -> bool:
+    """Validate a job config, printing any problems; True if it can be submitted"""
+    errors = validate_job_config(config)
+    for error in errors:
+        console.print(f"[red]Invalid configuration: {error}[/red]")
+    return not errors
+
+# Write buffer size for CSV exports and how many rows to write between flushes
+CSV_BUFFER_SIZE = 1 << 20
+CSV_FLUSH_ROWS = 10_000
+
+def save_to_csv(data: Iterable[Dict[str, Any]], output_path: str, fieldnames: list):
+    """Save data (a list or any iterable of row dicts) to CSV file"""
     import csv
+    import io
+    from itertools import islice
     
-    output_file = Path(output_path)
-    output_file.parent.mkdir(parents=True, exist_ok=True)
+    output_file = os.fspath(output_path)
+    parent = os.path.dirname(output_file)
+    if parent:
+        os.makedirs(parent, exist_ok=True)
     
     try:
-        with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(data)
-        console.print(f"[green]Data saved to: {output_file.absolute()}[/green]")
+        with open(output_file, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as csvfile:
+            # Rows are formatted into memory and handed to the file one chunk at a time
+            buf = io.StringIO()
+            writer = csv.writer(buf)
+            writer.writerow(fieldnames)
+            # Plain value rows in fieldnames order; missing fields are written empty
+            rows = ([row.get(name, '') for name in fieldnames] for row in data)
+            # Flush periodically so large exports reach the file (and any reader) steadily
+            while True:
+                chunk = list(islice(rows, CSV_FLUSH_ROWS))
+                writer.writerows(chunk)
+                csvfile.write(buf.getvalue())
+                buf.seek(0)
+                buf.truncate()
+                if not chunk:
+                    break
+                csvfile.flush()
+        console.print(f"[green]Data saved to: {os.path.abspath(output_file)}[/green]")
         return True
     except Exception as e:
         console.print(f"[red]Error saving to CSV: {e}[/red]")
         return False
 
+# Headers create_table gives special column styling
+_ID_HEADERS = frozenset({'id', 'job id'})
+_DATE_HEADERS = frozenset({'created', 'updated', 'created at', 'updated at'})
+
 def create_table(title: str, headers: List[str], rows: List[List[Any]], 
                  show_header: bool = True, show_lines: bool = False) -> Table:
     """Create a Rich table with consistent styling"""
@@ -203,20 +659,21 @@ def create_table(title: str, headers: List[str], rows: List[List[Any]],
     
     # Add columns with styling
     for header in headers:
-        if header.lower() in ['id', 'job id']:
+        key = header.lower()
+        if key in _ID_HEADERS:
             table.add_column(header, style="cyan", no_wrap=True)
-        elif header.lower() in ['status']:
+        elif key == 'status':
             table.add_column(header, no_wrap=True)
-        elif header.lower() in ['created', 'updated', 'created at', 'updated at']:
+        elif key in _DATE_HEADERS:
             table.add_column(header, style="dim")
         else:
             table.add_column(header)
     
-    # Add rows
+    # Add rows, converting values to strings (None shown as N/A); string cells pass through
+    _str = str
+    add_row = table.add_row
     for row in rows:
-        # Convert all values to strings and handle None
-        str_row = [str(val) if val is not None else "N/A" for val in row]
-        table.add_row(*str_row)
+        add_row(*[val if type(val) is _str else ("N/A" if val is None else _str(val)) for val in row])
     
     return table
 
@@ -242,16 +699,17 @@ def print_info(message: str):
 
 def print_yaml(data: Dict[str, Any], title: str = None):
     """Print YAML data with syntax highlighting"""
-    import yaml
-    yaml_str = yaml.dump(data, default_flow_style=False, sort_keys=False)
+    from rich.syntax import Syntax
+    yaml_str = yaml_dump(data)
     syntax = Syntax(yaml_str, "yaml", theme="monokai", line_numbers=False)
     if title:
         console.print(Panel(syntax, title=title, expand=False))
     else:
         console.print(syntax)
 
-def create_progress_bar() -> Progress:
+def create_progress_bar() -> "Progress":
     """Create a progress bar for long-running operations"""
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
     return Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -260,12 +718,60 @@ def create_progress_bar() -> Progress:
         console=console
     )
 
+# Rich styles are immutable, so the selector shares one instance of each
+_SELECTED_ROW_STYLE = Style(bgcolor="blue", bold=True)
+_PLAIN_ROW_STYLE = Style()
+
+# Lists up to this long are offered as a numbered prompt instead of a live selector
+_MENU_MAX_ITEMS = 9
+
+# Upper bound on keystrokes coalesced into one selection move
+_MAX_KEY_BATCH = 64
+
+def read_keys() -> List[str]:
+    """Block for one keystroke, then drain any already queued behind it.
+    
+    Holding an arrow key queues auto-repeat events faster than the table can
+    be redrawn; handling them as one batch means one redraw per batch.
+    """
+    import readchar
+    
+    keys = [readchar.readkey()]
+    if os.name == 'nt':
+        import msvcrt
+        while len(keys) < _MAX_KEY_BATCH and msvcrt.kbhit():
+            keys.append(readchar.readkey())
+        return keys
+    if not sys.stdin.isatty():
+        return keys
+    
+    import fcntl
+    
+    # readchar reads through sys.stdin's buffer, so poll by reading with the
+    # descriptor non-blocking: an empty key means nothing else is queued
+    fd = sys.stdin.fileno()
+    flags = fcntl.fcntl(fd, fcntl.F_GETFL)
+    fcntl.fcntl(fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
+    try:
+        while len(keys) < _MAX_KEY_BATCH:
+            try:
+                key = readchar.readkey()
+            except BlockingIOError:
+                break
+            if not key:
+                break
+            keys.append(key)
+    finally:
+        fcntl.fcntl(fd, fcntl.F_SETFL, flags)
+    return keys
+
 def interactive_select(
     items: List[Dict[str, Any]], 
     title: str = "Select an item",
     columns: List[Dict[str, str]] = None,
     id_field: str = 'id',
-    allow_none: bool = True
+    allow_none: bool = True,
+    confirm_single: bool = False
 ) -> Optional[Any]:
     """
     Interactive selection from a list of items using arrow keys.
@@ -273,9 +779,12 @@ def interactive_select(
     Args:
         items: List of dictionaries containing the items
         title: Title for the selection table
-        columns: List of column definitions [{"key": "field_name", "header": "Display Name", "style": "cyan"}]
+        columns: List of column definitions [{"key": "field_name", "header": "Display Name", "style": "cyan"}];
+            a column may give "formatter" (called with the field value) or
+            "row_formatter" (called with the whole item) instead of plain str()
         id_field: Field to return when item is selected
         allow_none: Whether to allow cancelling selection (returns None)
+        confirm_single: Make the user pick even a lone item (for destructive actions)
     
     Returns:
         Selected item's id_field value or None if cancelled
@@ -284,24 +793,30 @@ def interactive_select(
         console.print("[yellow]No items available for selection[/yellow]")
         return None
     
+    if len(items) == 1 and not confirm_single:
+        item_id = items[0].get(id_field)
+        console.print(f"[cyan]Only one item available, selecting {item_id}[/cyan]")
+        return item_id
+    
     if columns is None:
         # Default columns if not specified
         columns = [{"key": id_field, "header": "ID", "style": "cyan"}]
     
     selected_index = 0
     
-    def render_table(selected_idx):
+    def build_table(hint: str, numbered: bool = False):
         table = Table(
-            title=f"{title} - Use ↑↓ arrows to navigate, Enter to select" + 
-                  (", Ctrl+C to cancel" if allow_none else ""),
+            title=f"{title} - {hint}",
             show_header=True, 
             header_style="bold cyan"
         )
         
         # Add columns
+        if numbered:
+            table.add_column("#", style="bold", no_wrap=True, justify="right")
         for col in columns:
             table.add_column(
-                col.get("header", col["key"]), 
+                col.get("header", col.get("key")), 
                 style=col.get("style", "white"),
                 no_wrap=col.get("no_wrap", False),
                 width=col.get("width"),
@@ -309,16 +824,29 @@ def interactive_select(
                 overflow=col.get("overflow", "fold")
             )
         
-        # Add rows with selection highlighting
+        # Resolve each column's key and formatters once rather than per cell
+        col_specs = [
+            (
+                col.get("key"),
+                col.get("formatter") if callable(col.get("formatter")) else None,
+                col.get("row_formatter") if callable(col.get("row_formatter")) else None
+            )
+            for col in columns
+        ]
+        
+        # Add rows, highlighting the initially selected one unless choosing by number
         for idx, item in enumerate(items):
-            row_style = Style(bgcolor="blue", bold=True) if idx == selected_idx else Style()
-            row_data = []
+            row_style = _SELECTED_ROW_STYLE if idx == selected_index and not numbered else _PLAIN_ROW_STYLE
+            row_data = [str(idx + 1)] if numbered else []
             
-            for col in columns:
-                value = item.get(col["key"], "N/A")
+            for key, fmt, row_fmt in col_specs:
+                if row_fmt is not None:
+                    row_data.append(row_fmt(item))
+                    continue
+                value = item.get(key, "N/A")
                 # Apply any custom formatting
-                if "formatter" in col and callable(col["formatter"]):
-                    value = col["formatter"](value)
+                if fmt is not None:
+                    value = fmt(value)
                 else:
                     value = str(value) if value is not None else "N/A"
                 row_data.append(value)
@@ -327,23 +855,61 @@ def interactive_select(
         
         return table
     
+    # Short lists fit on screen, so a numbered prompt replaces the live arrow-key display
+    if len(items) <= _MENU_MAX_ITEMS and sys.stdin.isatty() and console.is_terminal:
+        console.print(build_table(
+            "Enter a number to select" + (", or leave blank to cancel" if allow_none else ""),
+            numbered=True
+        ))
+        while True:
+            try:
+                choice = console.input(f"Select [1-{len(items)}]: ").strip()
+            except (KeyboardInterrupt, EOFError):
+                if allow_none:
+                    console.print("\n[yellow]Selection cancelled[/yellow]")
+                    return None
+                raise
+            if not choice and allow_none:
+                return None
+            if choice.isdigit() and 1 <= int(choice) <= len(items):
+                return items[int(choice) - 1].get(id_field)
+            console.print(f"[red]Enter a number between 1 and {len(items)}[/red]")
+    
+    import readchar
+    from rich.live import Live
+    
+    # The table is built once; moving the selection only restyles the two affected rows
+    table = build_table(
+        "Use ↑↓ arrows to navigate, Enter to select" + (", Ctrl+C to cancel" if allow_none else "")
+    )
+    rows = table.rows
+    
+    def move_selection(step):
+        nonlocal selected_index
+        rows[selected_index].style = _PLAIN_ROW_STYLE
+        selected_index = (selected_index + step) % len(items)
+        rows[selected_index].style = _SELECTED_ROW_STYLE
+        # Live still holds the same table, so a refresh redraws the restyled rows
+        live.refresh()
+    
     try:
-        with Live(render_table(selected_index), console=console, auto_refresh=False) as live:
+        with Live(table, console=console, auto_refresh=False) as live:
             while True:
                 try:
-                    key = readchar.readkey()
-                    
-                    if key == readchar.key.UP:
-                        selected_index = (selected_index - 1) % len(items)
-                        live.update(render_table(selected_index), refresh=True)
-                    elif key == readchar.key.DOWN:
-                        selected_index = (selected_index + 1) % len(items)
-                        live.update(render_table(selected_index), refresh=True)
-                    elif key == readchar.key.ENTER or key == '\r' or key == '\n':
-                        selected_item = items[selected_index]
-                        return selected_item.get(id_field)
-                    elif allow_none and (key == readchar.key.CTRL_C or key == '\x03'):
-                        return None
+                    # Net out a burst of arrow keys and redraw once for the whole batch
+                    step = 0
+                    for key in read_keys():
+                        if key == readchar.key.UP:
+                            step -= 1
+                        elif key == readchar.key.DOWN:
+                            step += 1
+                        elif key == readchar.key.ENTER or key == '\r' or key == '\n':
+                            selected_item = items[(selected_index + step) % len(items)]
+                            return selected_item.get(id_field)
+                        elif allow_none and (key == readchar.key.CTRL_C or key == '\x03'):
+                            return None
+                    if step % len(items):
+                        move_selection(step)
                         
                 except KeyboardInterrupt:
                     if allow_none:
@@ -359,13 +925,14 @@ def interactive_select(
         console.print(f"[red]Error in selection: {e}[/red]")
         return None
 
-def select_job(client: APIClient, job_id: Optional[int] = None) -> Optional[int]:
+def select_job(client: APIClient, job_id: Optional[int] = None, confirm_single: bool = False) -> Optional[int]:
     """
     Select a job interactively or return the provided job_id.
     
     Args:
         client: API client instance
         job_id: Optional job ID. If None, shows interactive selection
+        confirm_single: Never auto-select a lone job (see interactive_select)
     
     Returns:
         Selected or provided job ID, or None if cancelled
@@ -373,65 +940,84 @@ def select_job(client: APIClient, job_id: Optional[int] = None) -> Optional[int]
     if job_id is not None:
         return job_id
     
+    from concurrent.futures import ThreadPoolExecutor
+    
     console.print("[cyan]Fetching available jobs...[/cyan]")
-    response = client.get("/jobs")
-    if not response:
-        return None
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        # Dataset names are fetched in the background while the job list streams in
+        datasets_future = pool.submit(client.get_cached, "/datasets")
+        job_items = client.iter_items("/jobs", "jobs.item")
+        if job_items is None:
+            return None
+        
+        ds_map = None
+        jobs = []
+        try:
+            # Reduce each job to its display fields as it arrives, so full configs are not kept
+            for job in job_items:
+                cfg = job.get('config') or {}
+                attack_cfg = cfg.get('attack') or {}
+                target_cfg = cfg.get('target') or {}
+                # Fallback for legacy configs
+                if not target_cfg and (cfg.get('models') or {}).get('target'):
+                    target_cfg = (cfg.get('models') or {}).get('target')
+                dataset_label = None
+                if cfg.get('dataset_id') is not None:
+                    if ds_map is None:
+                        ds_map = _dataset_names(datasets_future.result())
+                    ds_id = cfg.get('dataset_id')
+                    dataset_label = ds_map.get(ds_id, f"id:{ds_id}")
+                elif cfg.get('objectives'):
+                    dataset_label = "custom_objectives"
+                jobs.append({
+                    'job_id': job.get('job_id'),
+                    'status': job.get('status', 'N/A'),
+                    'algorithm': attack_cfg.get('type') or 'N/A',
+                    'target': target_cfg.get('name') or 'N/A',
+                    'dataset': dataset_label or 'N/A',
+                    'completed_objectives': job.get('completed_objectives', 0),
+                    'total_objectives': job.get('total_objectives', 0),
+                    'description': job.get('description', 'N/A'),
+                })
+        except stream_errors() as e:
+            # A malformed or truncated body, reported like any other failed request
+            _print_request_error(e)
+            return None
     
-    jobs = response.get('jobs', [])
     if not jobs:
         console.print("[yellow]No jobs found[/yellow]")
         return None
     
-    # Build dataset id -> name map for labeling
-    ds_map = {}
-    try:
-        ds_resp = client.get("/datasets")
-        ds_list = ds_resp if isinstance(ds_resp, list) else (ds_resp.get('datasets', []) if ds_resp else [])
-        for ds in ds_list:
-            ds_map[ds.get('id')] = ds.get('name')
-    except Exception:
-        pass
-    
     columns = [
         {"key": "job_id", "header": "Job ID", "style": "cyan", "no_wrap": True, "width": 8},
         {"key": "status", "header": "Status", "formatter": format_status_plain, "no_wrap": True, "width": 10},
         {"key": "algorithm", "header": "Algorithm", "no_wrap": True, "width": 14},
         {"key": "target", "header": "Target", "no_wrap": True, "width": 20},
         {"key": "dataset", "header": "Dataset", "no_wrap": True, "width": 20},
-        {"key": "progress", "header": "Progress", "no_wrap": True, "width": 10,
-         "formatter": lambda j: f"{j.get('completed_objectives', 0)}/{j.get('total_objectives', 0)}"},
+        {"header": "Progress", "row_formatter": _job_progress, "no_wrap": True, "width": 10},
         {"key": "description", "header": "Description", "max_width": 50, "overflow": "ellipsis"}
     ]
     
-    # Transform job data to include calculated fields
-    for job in jobs:
-        cfg = job.get('config') or {}
-        attack_cfg = cfg.get('attack') or {}
-        target_cfg = cfg.get('target') or {}
-        # Fallback for legacy configs
-        if not target_cfg and (cfg.get('models') or {}).get('target'):
-            target_cfg = (cfg.get('models') or {}).get('target')
-        dataset_label = None
-        if cfg.get('dataset_id') is not None:
-            ds_id = cfg.get('dataset_id')
-            dataset_label = ds_map.get(ds_id, f"id:{ds_id}")
-        elif cfg.get('objectives'):
-            dataset_label = "custom_objectives"
-        job['algorithm'] = attack_cfg.get('type') or 'N/A'
-        job['target'] = target_cfg.get('name') or 'N/A'
-        job['dataset'] = dataset_label or 'N/A'
-        job['progress'] = job  # Pass the whole job object for the formatter
-    
-    return interactive_select(jobs, "Select a Job", columns, id_field="job_id")
-
-def select_dataset(client: APIClient, dataset_name: Optional[str] = None) -> Optional[int]:
+    return interactive_select(jobs, "Select a Job", columns, id_field="job_id", confirm_single=confirm_single)
+
+def _job_progress(job: Dict[str, Any]) -> str:
+    """Format a job row's objective progress as completed/total"""
+    return f"{job.get('completed_objectives', 0)}/{job.get('total_objectives', 0)}"
+
+def _dataset_names(response: Any) -> Dict[Any, Any]:
+    """Build a dataset id -> name map from a /datasets response"""
+    datasets = response if isinstance(response, list) else (response.get('datasets', []) if response else [])
+    return {ds.get('id'): ds.get('name') for ds in datasets}
+
+def select_dataset(client: APIClient, dataset_name: Optional[str] = None,
+                   confirm_single: bool = False) -> Optional[int]:
     """
     Select a dataset interactively or resolve provided name/id to dataset_id.
     
     Args:
         client: API client instance
         dataset_name: Optional dataset name or id (as string). If None, shows interactive selection.
+        confirm_single: Never auto-select a lone dataset (see interactive_select)
     
     Returns:
         Selected dataset id, or None if cancelled/not found.
@@ -444,19 +1030,18 @@ def select_dataset(client: APIClient, dataset_name: Optional[str] = None) -> Opt
         except Exception:
             pass
         # Resolve by name lookup
-        response = client.get("/datasets")
-        if not response:
+        index = client.get_dataset_name_index()
+        if index is None:
             return None
-        datasets = response if isinstance(response, list) else response.get('datasets', [])
-        for ds in datasets:
-            if str(ds.get('name', '')).lower() == str(dataset_name).lower():
-                return ds.get('id')
+        dataset_id = index.get(str(dataset_name).casefold())
+        if dataset_id is not None:
+            return dataset_id
         console.print(f"[yellow]Dataset '{dataset_name}' not found[/yellow]")
         return None
     
     # Interactive selection
     console.print("[cyan]Fetching available datasets...[/cyan]")
-    response = client.get("/datasets")
+    response = client.get_cached("/datasets")
     if not response:
         return None
     
@@ -472,7 +1057,7 @@ def select_dataset(client: APIClient, dataset_name: Optional[str] = None) -> Opt
         {"key": "created_at", "header": "Created", "formatter": format_datetime, "no_wrap": True}
     ]
     
-    return interactive_select(datasets, "Select a Dataset", columns, id_field="id")
+    return interactive_select(datasets, "Select a Dataset", columns, id_field="id", confirm_single=confirm_single)
 
 def transform_config_for_api(raw_config: Dict[str, Any], client: APIClient) -> Dict[str, Any]:
     """
@@ -481,9 +1066,10 @@ def transform_config_for_api(raw_config: Dict[str, Any], client: APIClient) -> D
     - Resolve dataset name -> dataset_id
     - Preserve attack and objectives as-is
     """
-    import copy
-    config = copy.deepcopy(raw_config or {})
-    payload = config.get("config", {})
+    # Only top-level keys of config and config["config"] are replaced or removed below,
+    # so shallow copies keep the caller's config untouched without a deepcopy
+    config = dict(raw_config or {})
+    payload = dict(config.get("config", {}))
     
     # Map models.target -> target
     if "target" not in payload:
@@ -498,11 +1084,9 @@ def transform_config_for_api(raw_config: Dict[str, Any], client: APIClient) -> D
     # Resolve dataset name -> dataset_id
     if "dataset_id" not in payload and isinstance(payload.get("dataset"), str):
         try:
-            datasets = client.get("/datasets")
-            all_ds = datasets if isinstance(datasets, list) else (datasets.get('datasets', []) if datasets else [])
-            match = next((d for d in all_ds if str(d.get('name', '')).lower() == payload["dataset"].lower()), None)
-            if match and match.get('id') is not None:
-                payload["dataset_id"] = match['id']
+            dataset_id = (client.get_dataset_name_index() or {}).get(payload["dataset"].casefold())
+            if dataset_id is not None:
+                payload["dataset_id"] = dataset_id
                 # Remove legacy field to avoid server-side conflict
                 del payload["dataset"]
         except Exception:
@@ -534,7 +1118,7 @@ def select_algorithm(client: APIClient, algorithm_name: Optional[str] = None) ->
         return algorithm_name
     
     console.print("[cyan]Fetching available algorithms...[/cyan]")
-    response = client.get("/algorithms")
+    response = client.get_cached("/algorithms")
     if not response:
         return None
     